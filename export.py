@@ -0,0 +1,5 @@
+# export.py
+from scraper.export import run_export
+
+if __name__ == "__main__":
+    run_export()
@@ -0,0 +1,5 @@
+# hydrate.py
+from scraper.hydrate import run_hydrator
+
+if __name__ == "__main__":
+    run_hydrator()
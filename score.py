@@ -0,0 +1,5 @@
+# score.py
+from scraper.scoring import run_backfill
+
+if __name__ == "__main__":
+    run_backfill()
@@ -1,17 +1,15 @@
 # scraper/core.py
-import requests
 import json
 import sqlite3
 import sys
 from sqlite3 import Error
-from bs4 import BeautifulSoup
 import time as tm
 from itertools import groupby
 from datetime import datetime, timedelta, time
-import pandas as pd
 from urllib.parse import quote
-from langdetect import detect
-from langdetect.lang_detect_exception import LangDetectException
+
+# requests, BeautifulSoup, pandas and langdetect are imported inside the
+# functions that need them so importing this module stays cheap.
 
 # ----------------------------
 # Config & HTTP helpers
@@ -22,6 +20,9 @@ def load_config(file_name):
         return json.load(f)
 
 def get_with_retry(url, config, retries=3, delay=1):
+    import requests
+    from bs4 import BeautifulSoup
+
     for _ in range(retries):
         try:
             if len(config.get("proxies", {})) > 0:
@@ -88,9 +89,11 @@ def transform(soup):
 
     return joblist
 
+NO_DESCRIPTION = "Could not find Job Description"
+
 def transform_job(soup):
     if soup is None:
-        return "Could not find Job Description"
+        return NO_DESCRIPTION
     div = soup.find("div", class_="description__text description__text--rich")
     if div:
         # Remove unwanted elements
@@ -109,21 +112,20 @@ def transform_job(soup):
         text = text.replace("Show less", "").replace("Show more", "")
         return text
     else:
-        return "Could not find Job Description"
+        return NO_DESCRIPTION
 
 def safe_detect(text):
+    from langdetect import detect
+    from langdetect.lang_detect_exception import LangDetectException
+
     try:
         return detect(text)
     except LangDetectException:
         return "en"
 
-def remove_irrelevant_jobs(joblist, config):
-    # Filter by description, title include/exclude, language, and company exclude
-    new_joblist = [
-        job
-        for job in joblist
-        if not any(word.lower() in job["job_description"].lower() for word in config.get("desc_words", []))
-    ]
+def remove_irrelevant_cards(joblist, config):
+    # Filter by title include/exclude and company exclude (no description needed)
+    new_joblist = joblist
     if len(config.get("title_exclude", [])) > 0:
         new_joblist = [
             job
@@ -136,12 +138,6 @@ def remove_irrelevant_jobs(joblist, config):
             for job in new_joblist
             if any(word.lower() in job["title"].lower() for word in config["title_include"])
         ]
-    if len(config.get("languages", [])) > 0:
-        new_joblist = [
-            job
-            for job in new_joblist
-            if safe_detect(job["job_description"]) in config["languages"]
-        ]
     if len(config.get("company_exclude", [])) > 0:
         new_joblist = [
             job
@@ -150,6 +146,19 @@ def remove_irrelevant_jobs(joblist, config):
         ]
     return new_joblist
 
+def description_is_relevant(job, config):
+    # Description keyword and language checks
+    description = job["job_description"]
+    if any(word.lower() in description.lower() for word in config.get("desc_words", [])):
+        return False
+    if len(config.get("languages", [])) > 0 and safe_detect(description) not in config["languages"]:
+        return False
+    return True
+
+def remove_irrelevant_jobs(joblist, config):
+    # Filter by description, title include/exclude, language, and company exclude
+    return [job for job in remove_irrelevant_cards(joblist, config) if description_is_relevant(job, config)]
+
 def remove_duplicates(joblist, _config):
     # Duplicate by same title + company
     joblist.sort(key=lambda x: (x["title"], x["company"]))
@@ -189,6 +198,7 @@ def create_table(conn, df, table_name):
         "float64": "REAL",
         "datetime64[ns]": "TIMESTAMP",
         "object": "TEXT",
+        "str": "TEXT",  # pandas >= 3 string dtype
         "bool": "INTEGER",
     }
 
@@ -220,6 +230,8 @@ def create_table(conn, df, table_name):
 
 def update_table(conn, df, table_name):
     # Append only new rows compared to existing table
+    import pandas as pd
+
     df_existing = pd.read_sql(f"select * from {table_name}", conn)
 
     # Records unique in df relative to df_existing on (title, company, date)
@@ -241,6 +253,12 @@ def table_exists(conn, table_name):
     )
     return cur.fetchone()[0] == 1
 
+def resolve_table(config, which="jobs"):
+    # "jobs" -> jobs_tablename, "filtered" -> filtered_jobs_tablename
+    if which == "filtered":
+        return config["filtered_jobs_tablename"]
+    return config["jobs_tablename"]
+
 # ----------------------------
 # De-dup against DB
 # ----------------------------
@@ -276,7 +294,8 @@ def get_jobcards(config):
     print("Total job cards scraped: ", len(all_jobs))
     all_jobs = remove_duplicates(all_jobs, config)
     print("Total job cards after removing duplicates: ", len(all_jobs))
-    all_jobs = remove_irrelevant_jobs(all_jobs, config)
+    # Cards have no description yet; desc_words and languages run later
+    all_jobs = remove_irrelevant_cards(all_jobs, config)
     print("Total job cards after removing irrelevant jobs: ", len(all_jobs))
     return all_jobs
 
@@ -285,6 +304,8 @@ def find_new_jobs(all_jobs, conn, config):
     jobs_tablename = config["jobs_tablename"]
     filtered_jobs_tablename = config["filtered_jobs_tablename"]
 
+    import pandas as pd
+
     jobs_db = pd.DataFrame()
     filtered_jobs_db = pd.DataFrame()
 
@@ -308,12 +329,17 @@ def find_new_jobs(all_jobs, conn, config):
 # ----------------------------
 
 def main(config_file):
+    import pandas as pd
+    from .scoring import ensure_score_column, job_text, load_resume_vector, score_texts
+    from .hydrate import FETCHED, PENDING, ensure_status_column
+
     start_time = tm.perf_counter()
     job_list = []
 
     config = load_config(config_file)
     jobs_tablename = config["jobs_tablename"]
     filtered_jobs_tablename = config["filtered_jobs_tablename"]
+    defer_descriptions = config.get("defer_descriptions", False)
 
     # 1) Scrape search results and parse job cards
     all_jobs = get_jobcards(config)
@@ -326,6 +352,7 @@ def main(config_file):
     print("Total new jobs found after comparing to the database: ", len(all_jobs))
 
     # 4) For each new job, fetch full description and language
+    #    (or leave it pending for scraper.hydrate when descriptions are deferred)
     if len(all_jobs) > 0:
         for job in all_jobs:
             job_date = convert_date_format(job["date"])
@@ -336,15 +363,24 @@ def main(config_file):
                     continue
 
             print("Found new job: ", job["title"], "at ", job["company"], job["job_url"])
+            if defer_descriptions:
+                job["description_status"] = PENDING
+                job_list.append(job)
+                continue
             desc_soup = get_with_retry(job["job_url"], config)
             job["job_description"] = transform_job(desc_soup)
+            job["description_status"] = FETCHED
             language = safe_detect(job["job_description"])
             if language not in config["languages"]:
                 print("Job description language not supported: ", language)
             job_list.append(job)
 
         # 5) Final filtering by description/title/language/etc.
-        jobs_to_add = remove_irrelevant_jobs(job_list, config)
+        #    Deferred jobs get the description checks when they are hydrated.
+        if defer_descriptions:
+            jobs_to_add = remove_irrelevant_cards(job_list, config)
+        else:
+            jobs_to_add = remove_irrelevant_jobs(job_list, config)
         print("Total jobs to add: ", len(jobs_to_add))
 
         # 6) Complement for filtered table
@@ -359,16 +395,27 @@ def main(config_file):
         if not df_filtered.empty:
             df_filtered["date_loaded"] = str(datetime.now())
 
+        # 7b) Relevance score against the resume, if one is configured
+        if not df.empty:
+            resume_vector = load_resume_vector(config)
+            if resume_vector is not None:
+                df["score"] = score_texts((job_text(job) for job in jobs_to_add), resume_vector)
+
         # 8) Persist to DB
         if conn is not None:
             if not df.empty:
                 if table_exists(conn, jobs_tablename):
+                    ensure_score_column(conn, jobs_tablename)
+                    ensure_status_column(conn, jobs_tablename)
                     update_table(conn, df, jobs_tablename)
                 else:
                     create_table(conn, df, jobs_tablename)
+                    ensure_score_column(conn, jobs_tablename)
+                    ensure_status_column(conn, jobs_tablename)
 
             if not df_filtered.empty:
                 if table_exists(conn, filtered_jobs_tablename):
+                    ensure_status_column(conn, filtered_jobs_tablename)
                     update_table(conn, df_filtered, filtered_jobs_tablename)
                 else:
                     create_table(conn, df_filtered, filtered_jobs_tablename)
@@ -383,6 +430,9 @@ def main(config_file):
     else:
         print("No jobs found")
 
+    if defer_descriptions:
+        print("Descriptions are deferred; run `python hydrate.py` to fetch them")
+
     end_time = tm.perf_counter()
     print(f"Scraping finished in {end_time - start_time:.2f} seconds")
 
@@ -0,0 +1,209 @@
+# scraper/export.py
+import argparse
+import csv
+import io
+import json
+import sys
+
+from .core import create_connection, load_config, resolve_table, table_exists
+
+# Rows are pulled from SQLite with fetchmany() so only one chunk is held in
+# memory at a time, however large the table is.
+
+EXPORT_FORMATS = ("csv", "jsonl", "parquet")
+DEFAULT_CHUNK_SIZE = 5000
+
+# ----------------------------
+# Reading
+# ----------------------------
+
+def table_columns(conn, table_name):
+    cur = conn.execute(f'PRAGMA table_info("{table_name}")')
+    return [(row[1], (row[2] or "").upper()) for row in cur.fetchall()]
+
+def select_columns(conn, table_name, columns=None):
+    """
+    Validate requested columns against the table and return them with their
+    declared SQLite types. Returns every column when none are requested.
+    """
+    available = table_columns(conn, table_name)
+    if not columns:
+        return available
+    types = dict(available)
+    unknown = [c for c in columns if c not in types]
+    if unknown:
+        raise ValueError(f"Unknown column(s) for {table_name}: {', '.join(unknown)}")
+    return [(c, types[c]) for c in columns]
+
+def iter_chunks(conn, table_name, columns, since=None, since_id=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Yield lists of row tuples, ordered by id. `since` keeps rows whose
+    date_loaded is at or after the given value, `since_id` rows with a
+    greater id.
+    """
+    where, params = [], []
+    if since:
+        where.append("date_loaded >= ?")
+        params.append(since)
+    if since_id is not None:
+        where.append("id > ?")
+        params.append(int(since_id))
+
+    column_list = ", ".join(f'"{c}"' for c in columns)
+    query = f'SELECT {column_list} FROM "{table_name}"'
+    if where:
+        query += " WHERE " + " AND ".join(where)
+    query += " ORDER BY id"
+
+    cur = conn.execute(query, params)
+    try:
+        while True:
+            rows = cur.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield rows
+    finally:
+        cur.close()
+
+# ----------------------------
+# Writers
+# ----------------------------
+
+def stream_csv(columns, chunks):
+    # Yield the CSV text one chunk at a time
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(columns)
+    yield buf.getvalue()
+    for rows in chunks:
+        buf.seek(0)
+        buf.truncate()
+        writer.writerows(rows)
+        yield buf.getvalue()
+
+def stream_jsonl(columns, chunks):
+    for rows in chunks:
+        yield "".join(
+            json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n"
+            for row in rows
+        )
+
+# SQLite declared type -> (arrow type name, converter)
+PARQUET_TYPES = {
+    "INTEGER": ("int64", int),
+    "REAL": ("float64", float),
+}
+
+def _coerce(convert, value):
+    # SQLite is loosely typed, so a stray value that does not fit the
+    # declared type becomes null instead of failing the whole export.
+    if value is None:
+        return None
+    try:
+        return convert(value)
+    except (TypeError, ValueError):
+        return None
+
+def parquet_available():
+    import importlib.util
+
+    return importlib.util.find_spec("pyarrow") is not None
+
+def write_parquet(sink, column_types, chunks):
+    """Write chunks to `sink` (a path or binary file object), one row group per chunk."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("Parquet export requires pyarrow (pip install pyarrow)")
+
+    fields, converters = [], []
+    for name, sqltype in column_types:
+        arrow_type, convert = PARQUET_TYPES.get(sqltype, ("string", str))
+        fields.append((name, getattr(pa, arrow_type)()))
+        converters.append(convert)
+    schema = pa.schema(fields)
+
+    rows_written = 0
+    with pq.ParquetWriter(sink, schema) as writer:
+        for rows in chunks:
+            arrays = [
+                pa.array([_coerce(convert, row[i]) for row in rows], type=schema.field(i).type)
+                for i, convert in enumerate(converters)
+            ]
+            writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+            rows_written += len(rows)
+    return rows_written
+
+def export_jobs(conn, table_name, fmt, output, columns=None, since=None, since_id=None,
+                chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Export `table_name` to `output` (a path) in csv, jsonl or parquet.
+    Returns the number of rows written.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+    column_types = select_columns(conn, table_name, columns)
+    names = [name for name, _ in column_types]
+    chunks = iter_chunks(conn, table_name, names, since=since, since_id=since_id, chunk_size=chunk_size)
+
+    if fmt == "parquet":
+        return write_parquet(output, column_types, chunks)
+
+    rows_written = 0
+
+    def counted(chunks):
+        nonlocal rows_written
+        for rows in chunks:
+            rows_written += len(rows)
+            yield rows
+
+    stream = stream_csv if fmt == "csv" else stream_jsonl
+    newline = "" if fmt == "csv" else None
+    with open(output, "w", encoding="utf-8", newline=newline) as f:
+        for piece in stream(names, counted(chunks)):
+            f.write(piece)
+    return rows_written
+
+# ----------------------------
+# Command line
+# ----------------------------
+
+def run_export(argv=None):
+    parser = argparse.ArgumentParser(description="Export scraped jobs from the database.")
+    parser.add_argument("output", help="File to write")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, help="Defaults to the output file extension")
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--table", choices=("jobs", "filtered"), default="jobs")
+    parser.add_argument("--columns", help="Comma-separated list of columns (default: all)")
+    parser.add_argument("--since", help="Only rows with date_loaded >= this value, e.g. 2025-01-31")
+    parser.add_argument("--since-id", type=int, help="Only rows with id greater than this")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or args.output.rsplit(".", 1)[-1].lower()
+    if fmt not in EXPORT_FORMATS:
+        parser.error(f"cannot infer format from {args.output}; use --format")
+    columns = [c.strip() for c in args.columns.split(",")] if args.columns else None
+
+    config = load_config(args.config)
+    conn = create_connection(config)
+    if conn is None:
+        print("Error! cannot create the database connection.")
+        sys.exit(1)
+    table_name = resolve_table(config, args.table)
+    if not table_exists(conn, table_name):
+        print(f"Table {table_name} does not exist, nothing to export")
+        sys.exit(1)
+
+    try:
+        count = export_jobs(
+            conn, table_name, fmt, args.output,
+            columns=columns, since=args.since, since_id=args.since_id, chunk_size=args.chunk_size,
+        )
+    except (ValueError, RuntimeError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    finally:
+        conn.close()
+    print(f"Exported {count} records from {table_name} to {args.output}")
@@ -0,0 +1,188 @@
+# scraper/hydrate.py
+import argparse
+import sys
+import time as tm
+from datetime import datetime, timedelta
+
+from .core import (
+    NO_DESCRIPTION,
+    create_connection,
+    description_is_relevant,
+    get_with_retry,
+    load_config,
+    table_exists,
+    transform_job,
+)
+from .scoring import ensure_score_column, job_text, load_resume_vector, score_texts
+
+# With "defer_descriptions" enabled the scraper stores job cards straight
+# away with description_status = "pending". Descriptions are fetched later,
+# either by the worker below (best-scoring, newest jobs first) or on demand
+# when the web app opens a job. Rows without a status predate this feature
+# and already have their description.
+
+PENDING = "pending"
+FETCHED = "fetched"
+FAILED = "failed"       # no description on the page (throttled, login wall, ...);
+                        # retried by the worker after retry_after, or when opened
+FILTERED = "filtered"   # hidden by desc_words / languages after fetching
+
+DEFAULT_DELAY = 1.0
+DEFAULT_BATCH_SIZE = 20
+
+# Throttling: after a failed fetch the worker sleeps DEFAULT_BACKOFF seconds
+# (doubling on each consecutive failure) and re-reads the queue; after
+# MAX_CONSECUTIVE_FAILURES it ends the pass. A failed job becomes eligible
+# again RETRY_AFTER seconds later (doubling per attempt), up to MAX_ATTEMPTS.
+DEFAULT_BACKOFF = 30.0
+MAX_CONSECUTIVE_FAILURES = 3
+RETRY_AFTER = 300
+MAX_ATTEMPTS = 5
+
+def _now():
+    return datetime.now().isoformat(sep=" ", timespec="seconds")
+
+def ensure_status_column(conn, table_name):
+    """Add the description_status / retry columns and the status index to an existing table."""
+    cur = conn.cursor()
+    cur.execute(f'PRAGMA table_info("{table_name}")')
+    existing = {row[1] for row in cur.fetchall()}
+    for col, coltype in (("description_status", "TEXT"), ("fetch_attempts", "INTEGER"), ("retry_after", "TEXT")):
+        if col not in existing:
+            cur.execute(f'ALTER TABLE "{table_name}" ADD COLUMN "{col}" {coltype}')
+    cur.execute(
+        f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_description_status" '
+        f'ON "{table_name}" (description_status)'
+    )
+    conn.commit()
+
+def pending_jobs(conn, table_name, limit=DEFAULT_BATCH_SIZE):
+    # Pending jobs plus failed ones whose retry time has come.
+    # Priority: title relevance score, then most recently posted
+    query = f"""
+        SELECT id, title, company, job_url FROM "{table_name}"
+        WHERE description_status = ?
+           OR (description_status = ? AND IFNULL(fetch_attempts, 0) < ? AND IFNULL(retry_after, '') <= ?)
+        ORDER BY score DESC, date DESC, id DESC
+        LIMIT ?
+    """
+    cur = conn.execute(query, (PENDING, FAILED, MAX_ATTEMPTS, _now(), limit))
+    columns = [c[0] for c in cur.description]
+    return [dict(zip(columns, row)) for row in cur.fetchall()]
+
+def hydrate_job(conn, config, job, resume_vector=None):
+    """
+    Fetch and store the description for `job` (needs id, title and job_url),
+    apply the description filters and rescore it. Returns the new status.
+    """
+    table_name = config["jobs_tablename"]
+    soup = get_with_retry(job["job_url"], config)
+    description = transform_job(soup)
+    job = dict(job, job_description=description)
+
+    if description == NO_DESCRIPTION:
+        # A 429 or login page still parses; keep the row as it was so the
+        # job is neither filtered nor hidden on a page we could not read.
+        status = FAILED
+        row = conn.execute(
+            f'SELECT IFNULL(fetch_attempts, 0) FROM "{table_name}" WHERE id = ?', (job["id"],)
+        ).fetchone()
+        attempts = (row[0] if row else 0) + 1
+        retry_at = datetime.now() + timedelta(seconds=RETRY_AFTER * 2 ** (attempts - 1))
+        updates = {
+            "description_status": status,
+            "fetch_attempts": attempts,
+            "retry_after": retry_at.isoformat(sep=" ", timespec="seconds"),
+        }
+    else:
+        if description_is_relevant(job, config):
+            status = FETCHED
+        else:
+            status = FILTERED
+            print("Job filtered after fetching description: ", job["title"], job["job_url"])
+        updates = {"job_description": description, "description_status": status}
+        if status == FILTERED:
+            updates["hidden"] = 1
+        if resume_vector is not None:
+            updates["score"] = float(score_texts([job_text(job)], resume_vector)[0])
+
+    columns = ", ".join(f'"{key}" = ?' for key in updates)
+    # Only touch rows still waiting, so the worker and the web app never
+    # overwrite each other's result.
+    conn.execute(
+        f'UPDATE "{table_name}" SET {columns} WHERE id = ? AND description_status IN (?, ?)',
+        list(updates.values()) + [job["id"], PENDING, FAILED],
+    )
+    conn.commit()
+    return status
+
+def hydrate_pending(conn, config, limit=None, delay=DEFAULT_DELAY, backoff=DEFAULT_BACKOFF):
+    """
+    Hydrate pending jobs in priority order until none are left (or `limit`
+    is reached). The queue is re-read after every batch so jobs added by a
+    concurrent scrape are picked up. A failed fetch usually means LinkedIn
+    is throttling us, so the worker backs off and starts a new batch, and
+    ends the pass after MAX_CONSECUTIVE_FAILURES. Returns the number of jobs
+    processed.
+    """
+    table_name = config["jobs_tablename"]
+    resume_vector = load_resume_vector(config)
+    processed = 0
+    failures = 0
+    while limit is None or processed < limit:
+        batch_size = DEFAULT_BATCH_SIZE if limit is None else min(DEFAULT_BATCH_SIZE, limit - processed)
+        batch = pending_jobs(conn, table_name, batch_size)
+        if not batch:
+            break
+        for job in batch:
+            status = hydrate_job(conn, config, job, resume_vector)
+            print(f"Hydrated job {job['id']} ({status}): ", job["title"], "at ", job["company"])
+            processed += 1
+            if status == FAILED:
+                failures += 1
+                break
+            failures = 0
+            tm.sleep(delay)
+        if failures:
+            if failures >= MAX_CONSECUTIVE_FAILURES:
+                print("Descriptions keep failing, likely throttled; stopping this pass")
+                break
+            wait = backoff * 2 ** (failures - 1)
+            print(f"Fetch failed, backing off for {wait:.0f}s")
+            tm.sleep(wait)
+    return processed
+
+def run_hydrator(argv=None):
+    parser = argparse.ArgumentParser(description="Fetch descriptions for jobs stored with a pending description.")
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--limit", type=int, help="Stop after this many jobs")
+    parser.add_argument("--delay", type=float, default=DEFAULT_DELAY, help="Seconds to wait between requests")
+    parser.add_argument("--backoff", type=float, default=DEFAULT_BACKOFF,
+                        help="Seconds to wait after a failed (likely throttled) fetch; doubles on repeats")
+    parser.add_argument("--follow", type=float, metavar="SECONDS",
+                        help="Keep running, checking for new pending jobs every SECONDS")
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    conn = create_connection(config)
+    if conn is None:
+        print("Error! cannot create the database connection.")
+        sys.exit(1)
+    table_name = config["jobs_tablename"]
+    if not table_exists(conn, table_name):
+        print(f"Table {table_name} does not exist, nothing to hydrate")
+        sys.exit(1)
+    ensure_score_column(conn, table_name)
+    ensure_status_column(conn, table_name)
+
+    try:
+        while True:
+            processed = hydrate_pending(conn, config, limit=args.limit, delay=args.delay, backoff=args.backoff)
+            print(f"Hydrated {processed} jobs in the {table_name} table")
+            if args.follow is None:
+                break
+            tm.sleep(args.follow)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        conn.close()
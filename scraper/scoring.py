@@ -0,0 +1,183 @@
+# scraper/scoring.py
+import argparse
+import os
+import re
+import sys
+import zlib
+from functools import lru_cache
+
+from .core import create_connection, load_config, resolve_table, table_exists
+
+# Relevance of a job to the resume: cosine similarity between hashed term
+# vectors (sublinear tf, L2-normalised) of the job title + description and
+# of the resume text. Hashing keeps the vector size fixed without having to
+# fit or store a vocabulary, so scores can be computed at ingest time.
+
+N_FEATURES = 2 ** 16
+DEFAULT_BATCH_SIZE = 500
+
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#.\-]*[a-z0-9+#]|[a-z0-9]")
+
+STOP_WORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can
+could did do does doing for from had has have having he her here hers him his how
+i if in into is it its just may me more most must my no not of on or our ours out
+over own same she should so some such than that the their them then there these
+they this those through to too under until up very was we were what when where
+which while who whom why will with would you your yours
+""".split())
+
+# ----------------------------
+# Vectorizing
+# ----------------------------
+
+def tokenize(text):
+    return [t for t in TOKEN_RE.findall((text or "").lower()) if t not in STOP_WORDS]
+
+@lru_cache(maxsize=200_000)
+def _feature_index(token):
+    # crc32 is stable across runs, unlike the salted built-in hash()
+    return zlib.crc32(token.encode("utf-8")) % N_FEATURES
+
+def job_text(job):
+    return f'{job.get("title") or ""}\n{job.get("job_description") or ""}'
+
+def term_vector(text):
+    """Dense, L2-normalised hashed term vector for a single text."""
+    import numpy as np
+
+    vec = np.zeros(N_FEATURES, dtype=np.float64)
+    idx = np.fromiter((_feature_index(t) for t in tokenize(text)), dtype=np.int64)
+    if idx.size == 0:
+        return vec
+    feats, counts = np.unique(idx, return_counts=True)
+    vec[feats] = 1.0 + np.log(counts)
+    return vec / np.linalg.norm(vec)
+
+def score_texts(texts, resume_vector):
+    """
+    Score a batch of texts against `resume_vector` in one pass. The batch is
+    kept sparse as (row, feature, count) triples, so memory grows with the
+    number of tokens rather than batch size x N_FEATURES.
+    """
+    import numpy as np
+
+    texts = list(texts)
+    n = len(texts)
+    if n == 0:
+        return np.zeros(0, dtype=np.float64)
+
+    token_idx = [[_feature_index(t) for t in tokenize(text)] for text in texts]
+    lengths = np.fromiter((len(t) for t in token_idx), dtype=np.int64, count=n)
+    rows = np.repeat(np.arange(n, dtype=np.int64), lengths)
+    feats = np.fromiter((i for tokens in token_idx for i in tokens), dtype=np.int64, count=int(lengths.sum()))
+
+    keys, counts = np.unique(rows * N_FEATURES + feats, return_counts=True)
+    rows, feats = np.divmod(keys, N_FEATURES)
+    weights = 1.0 + np.log(counts)
+
+    norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=n))
+    dots = np.bincount(rows, weights=weights * resume_vector[feats], minlength=n)
+    scores = np.divide(dots, norms, out=np.zeros(n, dtype=np.float64), where=norms > 0)
+    return np.round(scores, 4)
+
+# ----------------------------
+# Resume
+# ----------------------------
+
+def read_resume(path):
+    from pdfminer.high_level import extract_text
+
+    try:
+        return extract_text(path)
+    except FileNotFoundError:
+        print(f"[ERROR] Resume file not found at: {path}")
+        return None
+    except Exception as e:
+        print(f"[ERROR] Failed to read resume PDF: {e}")
+        return None
+
+@lru_cache(maxsize=4)
+def _resume_vector(path, mtime):
+    # Keyed on mtime so an updated resume is picked up without a restart
+    text = read_resume(path)
+    if not text or not text.strip():
+        return None
+    return term_vector(text)
+
+def load_resume_vector(config):
+    """Term vector for config["resume_path"], or None if there is no usable resume."""
+    path = config.get("resume_path", "")
+    if not path or not os.path.isfile(path):
+        return None
+    return _resume_vector(path, os.path.getmtime(path))
+
+# ----------------------------
+# Database
+# ----------------------------
+
+def ensure_score_column(conn, table_name):
+    """Add the score column and its index to an existing table."""
+    cur = conn.cursor()
+    cur.execute(f'PRAGMA table_info("{table_name}")')
+    if "score" not in {row[1] for row in cur.fetchall()}:
+        cur.execute(f'ALTER TABLE "{table_name}" ADD COLUMN score REAL')
+    cur.execute(f'CREATE INDEX IF NOT EXISTS "idx_{table_name}_score" ON "{table_name}" (score)')
+    conn.commit()
+
+def backfill_scores(conn, table_name, resume_vector, rescore=False, batch_size=DEFAULT_BATCH_SIZE):
+    """Score rows in id order, one batch at a time. Returns the number of rows updated."""
+    ensure_score_column(conn, table_name)
+    condition = "" if rescore else "AND score IS NULL"
+    query = f"""
+        SELECT id, title, job_description FROM "{table_name}"
+        WHERE id > ? {condition}
+        ORDER BY id
+        LIMIT ?
+    """
+    last_id, updated = 0, 0
+    while True:
+        rows = conn.execute(query, (last_id, batch_size)).fetchall()
+        if not rows:
+            break
+        scores = score_texts(
+            (job_text({"title": title, "job_description": desc}) for _, title, desc in rows),
+            resume_vector,
+        )
+        conn.executemany(
+            f'UPDATE "{table_name}" SET score = ? WHERE id = ?',
+            [(float(s), row[0]) for s, row in zip(scores, rows)],
+        )
+        conn.commit()
+        updated += len(rows)
+        last_id = rows[-1][0]
+    return updated
+
+def run_backfill(argv=None):
+    parser = argparse.ArgumentParser(description="Compute relevance scores for jobs already in the database.")
+    parser.add_argument("--config", default="config.json")
+    parser.add_argument("--table", choices=("jobs", "filtered"), default="jobs")
+    parser.add_argument("--all", action="store_true", help="Rescore rows that already have a score")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    config = load_config(args.config)
+    resume_vector = load_resume_vector(config)
+    if resume_vector is None:
+        print("Error! resume_path in config.json does not point to a readable resume.")
+        sys.exit(1)
+
+    conn = create_connection(config)
+    if conn is None:
+        print("Error! cannot create the database connection.")
+        sys.exit(1)
+    table_name = resolve_table(config, args.table)
+    if not table_exists(conn, table_name):
+        print(f"Table {table_name} does not exist, nothing to score")
+        sys.exit(1)
+
+    try:
+        updated = backfill_scores(conn, table_name, resume_vector, rescore=args.all, batch_size=args.batch_size)
+    finally:
+        conn.close()
+    print(f"Scored {updated} records in the {table_name} table")
@@ -0,0 +1,39 @@
+import json
+
+import pytest
+
+from scraper import core
+
+
+@pytest.fixture
+def base_config(tmp_path):
+    """Minimal config pointing at a fresh database in tmp_path."""
+    return {
+        "db_path": str(tmp_path / "jobs.db"),
+        "jobs_tablename": "jobs",
+        "filtered_jobs_tablename": "filtered_jobs",
+    }
+
+
+@pytest.fixture
+def make_card():
+    """Factory for job cards as returned by scraper.core.transform()."""
+    def _card(n, title, date="2099-01-01"):
+        return {
+            "title": title, "company": f"Co {n}", "location": "Remote", "date": date,
+            "job_url": f"https://example.com/{n}/", "job_description": "",
+            "applied": 0, "hidden": 0, "interview": 0, "rejected": 0,
+        }
+    return _card
+
+
+@pytest.fixture
+def run_scrape(tmp_path, monkeypatch):
+    """Run core.main() with `config` on the given cards instead of scraping search pages."""
+    def _run(config, cards):
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps(config), encoding="utf-8")
+        monkeypatch.setattr(core, "get_jobcards", lambda _config: cards)
+        monkeypatch.chdir(tmp_path)
+        core.main(str(config_file))
+    return _run
@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+import sqlite3
+
+import pytest
+
+from scraper import export
+from webapp import create_app
+
+
+def _make_db(path, rows=12):
+    conn = sqlite3.connect(path)
+    conn.execute(
+        'CREATE TABLE "jobs" (id INTEGER PRIMARY KEY AUTOINCREMENT, '
+        '"title" TEXT, "company" TEXT, "applied" INTEGER, "date_loaded" TEXT)'
+    )
+    conn.executemany(
+        'INSERT INTO "jobs" (title, company, applied, date_loaded) VALUES (?, ?, ?, ?)',
+        [(f"Job {i}", f"Co {i}", i % 2, f"2025-01-{i + 1:02d} 10:00:00") for i in range(rows)],
+    )
+    conn.commit()
+    return conn
+
+
+@pytest.fixture
+def config(base_config):
+    _make_db(base_config["db_path"]).close()
+    return base_config
+
+
+def test_export_csv_and_jsonl_in_chunks(config, tmp_path):
+    conn = sqlite3.connect(config["db_path"])
+
+    out = tmp_path / "jobs.csv"
+    count = export.export_jobs(conn, "jobs", "csv", out, columns=["id", "title"], chunk_size=5)
+    assert count == 12
+    rows = list(csv.reader(io.StringIO(out.read_text(encoding="utf-8"))))
+    assert rows[0] == ["id", "title"]
+    assert rows[1] == ["1", "Job 0"]
+    assert len(rows) == 13
+
+    out = tmp_path / "jobs.jsonl"
+    count = export.export_jobs(conn, "jobs", "jsonl", out, since_id=10, chunk_size=5)
+    lines = [json.loads(line) for line in out.read_text(encoding="utf-8").splitlines()]
+    assert count == 2
+    assert [line["id"] for line in lines] == [11, 12]
+
+    count = export.export_jobs(conn, "jobs", "jsonl", out, since="2025-01-11")
+    assert count == 2
+
+
+def test_export_rejects_unknown_columns(config, tmp_path):
+    conn = sqlite3.connect(config["db_path"])
+    with pytest.raises(ValueError):
+        export.export_jobs(conn, "jobs", "csv", tmp_path / "x.csv", columns=["nope"])
+
+
+def test_export_parquet(config, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    conn = sqlite3.connect(config["db_path"])
+    out = tmp_path / "jobs.parquet"
+    assert export.export_jobs(conn, "jobs", "parquet", out, chunk_size=5) == 12
+    table = pq.read_table(out)
+    assert table.num_rows == 12
+    assert table.column("applied").to_pylist()[:2] == [0, 1]
+
+
+def test_export_endpoint_streams(config):
+    client = create_app(config=config).test_client()
+
+    resp = client.get("/export/jsonl?columns=id,company&since_id=9")
+    assert resp.status_code == 200
+    assert resp.headers["Content-Disposition"] == 'attachment; filename="jobs.jsonl"'
+    assert [json.loads(line) for line in resp.get_data(as_text=True).splitlines()] == [
+        {"id": 10, "company": "Co 9"},
+        {"id": 11, "company": "Co 10"},
+        {"id": 12, "company": "Co 11"},
+    ]
+
+    assert client.get("/export/xml").status_code == 400
+    assert client.get("/export/csv?columns=nope").status_code == 400
+    assert client.get("/export/csv?table=filtered").status_code == 404
+    assert client.get("/export/csv?table=filtered&columns=id").status_code == 404
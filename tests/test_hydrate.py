@@ -0,0 +1,142 @@
+import sqlite3
+
+import pytest
+from bs4 import BeautifulSoup
+
+from scraper import core, hydrate
+from webapp import create_app
+
+PAGE = '<div class="description__text description__text--rich"><p>{}</p></div>'
+THROTTLED_PAGE = "<html><body><h1>Too Many Requests</h1></body></html>"
+
+
+@pytest.fixture
+def pages(monkeypatch):
+    """url -> description served by the fake fetcher; unknown urls get a throttle page."""
+    served = {
+        "https://example.com/1/": "We build machine learning models in Python for retail forecasting.",
+        "https://example.com/2/": "Nous recherchons un ingénieur logiciel pour notre équipe à Paris.",
+        "https://example.com/3/": "Data engineering role working on pipelines and dashboards in SQL.",
+    }
+
+    def fake_get(url, config, retries=3, delay=1):
+        html = PAGE.format(served[url]) if url in served else THROTTLED_PAGE
+        return BeautifulSoup(html, "html.parser")
+
+    monkeypatch.setattr(hydrate, "get_with_retry", fake_get)
+    return served
+
+
+@pytest.fixture
+def config(base_config, pages):
+    return dict(
+        base_config,
+        desc_words=["dashboards"],
+        languages=["en"],
+        title_include=[],
+        title_exclude=["intern"],
+        company_exclude=[],
+        days_to_scrape=10,
+        defer_descriptions=True,
+    )
+
+
+@pytest.fixture
+def scrape_cards(run_scrape, monkeypatch):
+    def no_fetch(*args, **kwargs):
+        raise AssertionError("descriptions must not be fetched during a deferred scrape")
+
+    monkeypatch.setattr(core, "get_with_retry", no_fetch)
+    return run_scrape
+
+
+def test_deferred_scrape_then_hydrate(config, pages, scrape_cards, make_card):
+    cards = [
+        make_card(1, "ML Engineer", date="2099-01-01"),
+        make_card(2, "Software Engineer", date="2099-01-03"),
+        make_card(3, "Data Engineer", date="2099-01-02"),
+        make_card(4, "Data Intern"),
+    ]
+    scrape_cards(config, cards)
+
+    conn = sqlite3.connect(config["db_path"])
+    rows = conn.execute("SELECT title, description_status FROM jobs ORDER BY id").fetchall()
+    assert sorted(rows) == [
+        ("Data Engineer", "pending"), ("ML Engineer", "pending"), ("Software Engineer", "pending"),
+    ]
+    assert conn.execute("SELECT title FROM filtered_jobs").fetchall() == [("Data Intern",)]
+
+    # Without a resume score, newest postings are hydrated first
+    queue = hydrate.pending_jobs(conn, "jobs")
+    assert [job["title"] for job in queue] == ["Software Engineer", "Data Engineer", "ML Engineer"]
+
+    assert hydrate.hydrate_pending(conn, config, delay=0) == 3
+    result = dict(conn.execute("SELECT title, description_status || ':' || hidden FROM jobs").fetchall())
+    assert result == {
+        "ML Engineer": "fetched:0",
+        "Software Engineer": "filtered:1",   # French description
+        "Data Engineer": "filtered:1",       # matches desc_words
+    }
+    assert hydrate.pending_jobs(conn, "jobs") == []
+
+
+def test_throttled_page_is_marked_failed(config, pages, scrape_cards, make_card):
+    config["languages"] = ["fr"]   # the placeholder text must not be language-checked
+    scrape_cards(config, [make_card(1, "ML Engineer")])
+    del pages["https://example.com/1/"]
+
+    conn = sqlite3.connect(config["db_path"])
+    job = hydrate.pending_jobs(conn, "jobs")[0]
+    assert hydrate.hydrate_job(conn, config, job) == hydrate.FAILED
+    row = conn.execute("SELECT job_description, description_status, hidden, score FROM jobs").fetchone()
+    assert row == ("", "failed", 0, None)
+
+
+def test_job_details_hydrates_on_demand(config, pages, scrape_cards, make_card):
+    scrape_cards(config, [make_card(1, "ML Engineer"), make_card(2, "AI Engineer")])
+    client = create_app(config=config).test_client()
+
+    job = client.get("/job_details/1").get_json()
+    assert job["description_status"] == "fetched"
+    assert job["job_description"] == pages["https://example.com/1/"]
+
+    # A throttled fetch is stored as failed and retried on the next open
+    del pages["https://example.com/2/"]
+    job = client.get("/job_details/2").get_json()
+    assert job["description_status"] == "failed"
+    assert job["job_description"] == ""
+
+    pages["https://example.com/2/"] = "Python and machine learning research."
+    job = client.get("/job_details/2").get_json()
+    assert job["description_status"] == "fetched"
+    assert job["job_description"] == "Python and machine learning research."
+
+
+def test_worker_backs_off_when_throttled_and_retries_later(config, pages, scrape_cards, make_card, monkeypatch):
+    scrape_cards(config, [make_card(1, "ML Engineer"), make_card(2, "AI Engineer"), make_card(3, "Data Engineer")])
+    conn = sqlite3.connect(config["db_path"])
+    sleeps = []
+    monkeypatch.setattr(hydrate.tm, "sleep", sleeps.append)
+
+    # LinkedIn throttles every request: back off (doubling) and stop the pass
+    saved = dict(pages)
+    pages.clear()
+    processed = hydrate.hydrate_pending(conn, config, delay=0, backoff=10)
+    assert processed == hydrate.MAX_CONSECUTIVE_FAILURES == 3
+    assert sleeps == [10, 20]
+    rows = conn.execute("SELECT description_status, fetch_attempts, hidden, job_description FROM jobs").fetchall()
+    assert rows == [("failed", 1, 0, "")] * 3
+    # Not retried before retry_after
+    assert hydrate.pending_jobs(conn, "jobs") == []
+
+    # Later pass, once retry_after has passed and throttling has stopped
+    conn.execute("UPDATE jobs SET retry_after = '2000-01-01 00:00:00'")
+    conn.commit()
+    pages.update(saved)
+    assert hydrate.hydrate_pending(conn, config, delay=0, backoff=10) == 3
+    result = dict(conn.execute("SELECT title, description_status || ':' || hidden FROM jobs").fetchall())
+    assert result == {
+        "ML Engineer": "fetched:0",
+        "AI Engineer": "filtered:1",      # French description
+        "Data Engineer": "filtered:1",    # matches desc_words
+    }
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Generous ceilings (seconds) for a cold import; they only exist to catch a
+# heavy dependency creeping back onto the import path.
+IMPORT_BUDGETS = {
+    "scraper.core": 0.25,
+    "webapp": 1.5,
+}
+
+HEAVY_MODULES = ["pandas", "bs4", "langdetect", "openai", "pdfminer", "numpy"]
+
+
+def _import_in_subprocess(module, tmp_path):
+    # Run from an empty directory: an import that reads config.json or
+    # touches the database would fail or leave files behind.
+    code = (
+        "import sys, time, importlib\n"
+        "start = time.perf_counter()\n"
+        f"importlib.import_module({module!r})\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"heavy = {HEAVY_MODULES!r}\n"
+        "print(elapsed)\n"
+        "print(','.join(m for m in heavy if m in sys.modules))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed, loaded = (result.stdout.splitlines() + [""])[:2]
+    return float(elapsed), loaded
+
+
+def test_imports_are_lazy_and_side_effect_free(tmp_path):
+    for module, budget in IMPORT_BUDGETS.items():
+        elapsed, loaded = _import_in_subprocess(module, tmp_path)
+        assert loaded == "", f"importing {module} pulled in: {loaded}"
+        assert list(tmp_path.iterdir()) == [], f"importing {module} wrote files"
+        assert elapsed < budget, f"importing {module} took {elapsed:.3f}s (budget {budget}s)"
@@ -0,0 +1,84 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from scraper import scoring
+from webapp import database
+
+RESUME = "Data scientist with Python, PyTorch and SQL experience building machine learning models."
+
+
+def test_batch_scores_match_single_vectors():
+    resume_vector = scoring.term_vector(RESUME)
+    texts = [
+        "Machine learning engineer: Python, PyTorch, model deployment.",
+        "Graphic designer for print and packaging.",
+        "",
+        "Python python python SQL",
+    ]
+    scores = scoring.score_texts(texts, resume_vector)
+
+    expected = [float(scoring.term_vector(t) @ resume_vector) for t in texts]
+    assert scores == pytest.approx(expected, abs=1e-4)
+    assert scores[0] > scores[1]
+    assert scores[2] == 0.0
+
+
+def test_backfill_and_sort_by_score(base_config):
+    config = base_config
+    conn = sqlite3.connect(config["db_path"])
+    conn.execute(
+        'CREATE TABLE "jobs" (id INTEGER PRIMARY KEY AUTOINCREMENT, "title" TEXT, "company" TEXT, '
+        '"location" TEXT, "date" TEXT, "job_url" TEXT, "job_description" TEXT, "hidden" INTEGER)'
+    )
+    conn.executemany(
+        'INSERT INTO "jobs" (title, job_description, hidden) VALUES (?, ?, 0)',
+        [
+            ("Data Scientist", "Python, SQL and machine learning models"),
+            ("Barista", "Make coffee"),
+            ("ML Engineer", "PyTorch models in Python"),
+        ],
+    )
+    conn.commit()
+
+    resume_vector = scoring.term_vector(RESUME)
+    assert scoring.backfill_scores(conn, "jobs", resume_vector, batch_size=2) == 3
+    # Already scored rows are skipped unless rescoring
+    assert scoring.backfill_scores(conn, "jobs", resume_vector) == 0
+    indexes = {row[1] for row in conn.execute('PRAGMA index_list("jobs")')}
+    assert "idx_jobs_score" in indexes
+    conn.close()
+
+    database.ensure_columns(config)
+    indexes = {row[1] for row in sqlite3.connect(config["db_path"]).execute('PRAGMA index_list("jobs")')}
+    assert {"idx_jobs_score", "idx_jobs_description_status"} <= indexes
+
+    jobs = database.get_jobs(config, sort="score")
+    assert [job["title"] for job in jobs][-1] == "Barista"
+    assert np.all(np.diff([job["score"] for job in jobs]) <= 0)
+
+    top = database.get_jobs(config, min_score=jobs[1]["score"])
+    assert {job["title"] for job in top} == {jobs[0]["title"], jobs[1]["title"]}
+
+
+def test_main_scores_new_jobs_at_ingest(base_config, make_card, run_scrape, monkeypatch):
+    from bs4 import BeautifulSoup
+
+    from scraper import core
+
+    config = dict(base_config, desc_words=[], languages=["en"], days_to_scrape=10)
+    page = '<div class="description__text description__text--rich"><p>Python and SQL for machine learning.</p></div>'
+    monkeypatch.setattr(core, "get_with_retry", lambda url, config: BeautifulSoup(page, "html.parser"))
+    monkeypatch.setattr(scoring, "load_resume_vector", lambda config: scoring.term_vector(RESUME))
+
+    # First run creates the table, the second appends to it
+    run_scrape(config, [make_card(1, "Data Scientist 1"), make_card(2, "Data Scientist 2")])
+    run_scrape(config, [make_card(3, "Data Scientist 3")])
+
+    conn = sqlite3.connect(config["db_path"])
+    scores = conn.execute("SELECT title, score FROM jobs ORDER BY id").fetchall()
+    assert [title for title, _ in scores] == ["Data Scientist 1", "Data Scientist 2", "Data Scientist 3"]
+    assert all(score is not None and score > 0 for _, score in scores)
+    indexes = {row[1] for row in conn.execute('PRAGMA index_list("jobs")')}
+    assert "idx_jobs_score" in indexes
@@ -1,8 +1,21 @@
 # webapp/__init__.py
 from flask import Flask
+from scraper.core import load_config
+from . import database as dbsvc
 from .routes import web_bp
 
-def create_app():
+def create_app(config_file="config.json", config=None):
+    """
+    Build the Flask app. The config is read once here and shared with the
+    views through app.config["LINKHUNT"]; nothing is loaded at import time.
+    """
+    if config is None:
+        config = load_config(config_file)
+
     app = Flask(__name__, template_folder="../templates", static_folder="../static")
+    app.config["LINKHUNT"] = config
     app.register_blueprint(web_bp)
+
+    # Run lightweight migration once per app instead of on import
+    dbsvc.ensure_columns(config)
     return app
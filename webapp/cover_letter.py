@@ -1,75 +1,35 @@
 # webapp/cover_letter.py
-import json
 import sqlite3
-from pathlib import Path
-from pdfminer.high_level import extract_text
-from openai import OpenAI
-
-# Load configuration
-with open("config.json", "r", encoding="utf-8") as f:
-    config = json.load(f)
-
-DB_PATH = Path(config.get("db_path", "data/jobs.db"))
-TABLE_NAME = config.get("jobs_tablename", "jobs")  # use the same table as the legacy app
-OPENAI_API_KEY = config.get("OpenAI_API_KEY", "")
-OPENAI_MODEL = config.get("OpenAI_Model", "gpt-4o")
-RESUME_PATH = config.get("resume_path", "")
-
-def _connect():
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    return sqlite3.connect(DB_PATH)
-
-def _ensure_columns():
-    """Ensure the jobs table has a cover_letter column (matches legacy behavior)."""
-    with _connect() as conn:
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT count(name) FROM sqlite_master WHERE type='table' AND name=?",
-            (TABLE_NAME,)
-        )
-        if cur.fetchone()[0] != 1:
-            return
-        cur.execute(f"PRAGMA table_info({TABLE_NAME})")
-        existing = {row[1] for row in cur.fetchall()}
-        if "cover_letter" not in existing:
-            cur.execute(f'ALTER TABLE "{TABLE_NAME}" ADD COLUMN cover_letter TEXT')
-        conn.commit()
+from scraper.scoring import read_resume
+from .database import connect, _table_name
 
-_ensure_columns()
+# openai (and pdfminer, via read_resume) are imported on first use; the
+# cover_letter column is migrated by database.ensure_columns() when the app
+# is created.
 
-def _fetch_job(job_id: int):
+def _fetch_job(config, job_id: int):
     query = f"""
         SELECT id, title, company, location, job_description, cover_letter
-        FROM {TABLE_NAME}
+        FROM {_table_name(config)}
         WHERE id = ?
     """
-    with _connect() as conn:
+    with connect(config) as conn:
         conn.row_factory = sqlite3.Row
         row = conn.execute(query, (job_id,)).fetchone()
         return dict(row) if row else {}
 
-def _store_cover_letter(job_id: int, text: str):
-    with _connect() as conn:
+def _store_cover_letter(config, job_id: int, text: str):
+    with connect(config) as conn:
         conn.execute(
-            f'UPDATE "{TABLE_NAME}" SET cover_letter = ? WHERE id = ?',
+            f'UPDATE "{_table_name(config)}" SET cover_letter = ? WHERE id = ?',
             (text, job_id)
         )
         conn.commit()
 
-def _read_resume(path: str) -> str | None:
-    try:
-        return extract_text(path)
-    except FileNotFoundError:
-        print(f"[ERROR] Resume file not found at: {path}")
-        return None
-    except Exception as e:
-        print(f"[ERROR] Failed to read resume PDF: {e}")
-        return None
-
-def _chat_complete(client: OpenAI, prompt: str) -> str | None:
+def _chat_complete(client, model: str, prompt: str) -> str | None:
     try:
         completion = client.chat.completions.create(
-            model=OPENAI_MODEL,
+            model=model,
             messages=[{"role": "user", "content": prompt}],
         )
         return completion.choices[0].message.content
@@ -77,12 +37,12 @@ def _chat_complete(client: OpenAI, prompt: str) -> str | None:
         print(f"[ERROR] OpenAI completion failed: {e}")
         return None
 
-def generate_and_store_cover_letter(job_id: int):
+def generate_and_store_cover_letter(config, job_id: int):
     """
     Generates (or retrieves existing) cover letter for a job posting using
     the same two-step OpenAI prompt flow as the original app.
     """
-    job = _fetch_job(job_id)
+    job = _fetch_job(config, job_id)
     if not job:
         return None
 
@@ -90,16 +50,21 @@ def generate_and_store_cover_letter(job_id: int):
     if job.get("cover_letter"):
         return job["cover_letter"]
 
+    api_key = config.get("OpenAI_API_KEY", "")
+    model = config.get("OpenAI_Model", "gpt-4o")
+
     # Validate API key and resume
-    if not OPENAI_API_KEY:
+    if not api_key:
         print("[ERROR] OpenAI API key is empty in config.json (OpenAI_API_KEY).")
         return None
 
-    resume_text = _read_resume(RESUME_PATH)
+    resume_text = read_resume(config.get("resume_path", ""))
     if resume_text is None:
         return None
 
-    client = OpenAI(api_key=OPENAI_API_KEY)
+    from openai import OpenAI
+
+    client = OpenAI(api_key=api_key)
 
     # ----- Step 1 prompt (matches legacy content) -----
     consideration = ""  # kept to match original structure
@@ -121,7 +86,7 @@ def generate_and_store_cover_letter(job_id: int):
     if consideration:
         user_prompt += "\nConsider incorporating that " + consideration
 
-    first_response = _chat_complete(client, user_prompt)
+    first_response = _chat_complete(client, model, user_prompt)
     if first_response is None:
         return None
 
@@ -140,8 +105,8 @@ def generate_and_store_cover_letter(job_id: int):
         "Please respond with the final cover letter only."
     )
 
-    final_response = _chat_complete(client, user_prompt2) or first_response
+    final_response = _chat_complete(client, model, user_prompt2) or first_response
 
     # Store and return
-    _store_cover_letter(job_id, final_response)
+    _store_cover_letter(config, job_id, final_response)
     return final_response
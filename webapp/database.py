@@ -1,14 +1,9 @@
 # webapp/database.py
-import json
 import sqlite3
 from pathlib import Path
-
-# Load configuration from config.json
-with open("config.json", "r", encoding="utf-8") as f:
-    config = json.load(f)
-
-DB_PATH = Path(config.get("db_path", "data/jobs.db"))
-TABLE_NAME = config.get("jobs_tablename", "jobs")  # read from the same table the legacy app used
+from scraper.core import table_exists
+from scraper.hydrate import ensure_status_column
+from scraper.scoring import ensure_score_column
 
 NEEDED_COLUMNS = {
     "applied": "INTEGER DEFAULT 0",
@@ -18,53 +13,75 @@ NEEDED_COLUMNS = {
     "cover_letter": "TEXT"
 }
 
-def _connect():
+# get_jobs() sort keys -> ORDER BY clauses (NULL scores sort last in DESC)
+SORT_ORDERS = {
+    "id": "id DESC",
+    "score": "score DESC, id DESC",
+}
+
+def _table_name(config):
+    # read from the same table the legacy app used
+    return config.get("jobs_tablename", "jobs")
+
+def connect(config):
     """Create a SQLite connection."""
+    db_path = Path(config.get("db_path", "data/jobs.db"))
     # Ensure parent folder exists
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    return sqlite3.connect(DB_PATH)
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    return sqlite3.connect(db_path)
 
-def _ensure_columns():
-    """Add any missing columns (applied/rejected/interview/hidden/cover_letter)."""
-    with _connect() as conn:
-        cur = conn.cursor()
-        # check if table exists; if not, nothing to migrate here (scraper creates it)
-        cur.execute(
-            "SELECT count(name) FROM sqlite_master WHERE type='table' AND name=?",
-            (TABLE_NAME,)
-        )
-        if cur.fetchone()[0] != 1:
+def ensure_columns(config):
+    """
+    Add any missing columns (applied/rejected/interview/hidden/cover_letter),
+    plus the score and description_status columns and indexes, using the same
+    helpers as the scraper so both produce the same schema.
+    """
+    table_name = _table_name(config)
+    with connect(config) as conn:
+        # if the table does not exist, nothing to migrate here (scraper creates it)
+        if not table_exists(conn, table_name):
             return
 
-        cur.execute(f"PRAGMA table_info({TABLE_NAME})")
+        cur = conn.cursor()
+        cur.execute(f"PRAGMA table_info({table_name})")
         existing_cols = {row[1] for row in cur.fetchall()}
         for col, coltype in NEEDED_COLUMNS.items():
             if col not in existing_cols:
-                cur.execute(f'ALTER TABLE {TABLE_NAME} ADD COLUMN "{col}" {coltype}')
+                cur.execute(f'ALTER TABLE {table_name} ADD COLUMN "{col}" {coltype}')
         conn.commit()
 
-# Run lightweight migration on import
-_ensure_columns()
+        ensure_score_column(conn, table_name)
+        ensure_status_column(conn, table_name)
 
-def get_jobs():
-    """Retrieve all non-hidden jobs from the database."""
+def get_jobs(config, sort="id", min_score=None):
+    """
+    Retrieve all non-hidden jobs from the database, newest first or by
+    relevance score (sort="score"), optionally only those scoring at least
+    `min_score`. Scores are precomputed by scraper.scoring.
+    """
+    order_by = SORT_ORDERS.get(sort, SORT_ORDERS["id"])
+    params = []
+    score_filter = ""
+    if min_score is not None:
+        score_filter = "AND score >= ?"
+        params.append(min_score)
     query = f"""
         SELECT id, title, company, location, date, job_url, job_description,
                IFNULL(applied, 0)   AS applied,
                IFNULL(rejected, 0)  AS rejected,
                IFNULL(interview, 0) AS interview,
                IFNULL(hidden, 0)    AS hidden,
-               cover_letter
-        FROM {TABLE_NAME}
-        WHERE IFNULL(hidden, 0) = 0
-        ORDER BY id DESC
+               cover_letter, score
+        FROM {_table_name(config)}
+        WHERE IFNULL(hidden, 0) = 0 {score_filter}
+        ORDER BY {order_by}
     """
-    with _connect() as conn:
+    with connect(config) as conn:
         conn.row_factory = sqlite3.Row
-        rows = conn.execute(query).fetchall()
+        rows = conn.execute(query, params).fetchall()
         return [dict(r) for r in rows]
 
-def get_job(job_id: int):
+def get_job(config, job_id: int):
     """Retrieve a single job record by ID."""
     query = f"""
         SELECT id, title, company, location, date, job_url, job_description,
@@ -72,25 +89,25 @@ def get_job(job_id: int):
                IFNULL(rejected, 0)  AS rejected,
                IFNULL(interview, 0) AS interview,
                IFNULL(hidden, 0)    AS hidden,
-               cover_letter
-        FROM {TABLE_NAME}
+               cover_letter, score, description_status
+        FROM {_table_name(config)}
         WHERE id = ?
     """
-    with _connect() as conn:
+    with connect(config) as conn:
         conn.row_factory = sqlite3.Row
         row = conn.execute(query, (job_id,)).fetchone()
         return dict(row) if row else {}
 
-def update_flag(job_id: int, **flags):
+def update_flag(config, job_id: int, **flags):
     """
     Update job status flags like applied, rejected, interview, or hidden.
-    Example: update_flag(5, applied=1)
+    Example: update_flag(config, 5, applied=1)
     """
     if not flags:
         return 0
     columns = ", ".join([f'"{key}" = ?' for key in flags])
     values = list(flags.values()) + [job_id]
-    with _connect() as conn:
-        cur = conn.execute(f'UPDATE "{TABLE_NAME}" SET {columns} WHERE id = ?', values)
+    with connect(config) as conn:
+        cur = conn.execute(f'UPDATE "{_table_name(config)}" SET {columns} WHERE id = ?', values)
         conn.commit()
         return cur.rowcount
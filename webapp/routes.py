@@ -1,41 +1,120 @@
 # webapp/routes.py
-from flask import Blueprint, render_template, jsonify
+import tempfile
+from contextlib import closing
+from flask import Blueprint, Response, current_app, render_template, jsonify, request, stream_with_context
+from scraper import export as exportsvc
+from scraper.core import resolve_table, table_exists
+from scraper import hydrate as hydratesvc
+from scraper.scoring import load_resume_vector
 from . import database as dbsvc
 from . import cover_letter as clsvc
 
 web_bp = Blueprint("web", __name__)
 
+def _config():
+    return current_app.config["LINKHUNT"]
+
 @web_bp.route("/")
 def index():
-    jobs = dbsvc.get_jobs()
-    return render_template("jobs.html", jobs=jobs)
+    sort = request.args.get("sort", "id")
+    min_score = request.args.get("min_score", type=float)
+    jobs = dbsvc.get_jobs(_config(), sort=sort, min_score=min_score)
+    return render_template("jobs.html", jobs=jobs, sort=sort, min_score=min_score)
 
 @web_bp.route("/job_details/<int:job_id>")
 def job_details(job_id):
-    job = dbsvc.get_job(job_id)
+    config = _config()
+    job = dbsvc.get_job(config, job_id)
+    if job.get("description_status") in (hydratesvc.PENDING, hydratesvc.FAILED):
+        # Description was deferred at scrape time: fetch it now and cache it in the row
+        with dbsvc.connect(config) as conn:
+            hydratesvc.hydrate_job(conn, config, job, load_resume_vector(config))
+        job = dbsvc.get_job(config, job_id)
     return jsonify(job)
 
 @web_bp.route("/mark_applied/<int:job_id>", methods=["POST"])
 def mark_applied(job_id):
-    updated = dbsvc.update_flag(job_id, applied=1)
+    updated = dbsvc.update_flag(_config(), job_id, applied=1)
     return jsonify({"success": bool(updated)})
 
 @web_bp.route("/mark_rejected/<int:job_id>", methods=["POST"])
 def mark_rejected(job_id):
-    updated = dbsvc.update_flag(job_id, rejected=1)
+    updated = dbsvc.update_flag(_config(), job_id, rejected=1)
     return jsonify({"success": bool(updated)})
 
 @web_bp.route("/mark_interview/<int:job_id>", methods=["POST"])
 def mark_interview(job_id):
-    updated = dbsvc.update_flag(job_id, interview=1)
+    updated = dbsvc.update_flag(_config(), job_id, interview=1)
     return jsonify({"success": bool(updated)})
 
 @web_bp.route("/hide_job/<int:job_id>", methods=["POST"])
 def hide_job(job_id):
-    updated = dbsvc.update_flag(job_id, hidden=1)
+    updated = dbsvc.update_flag(_config(), job_id, hidden=1)
     return jsonify({"success": bool(updated)})
 
 @web_bp.route("/get_CoverLetter/<int:job_id>", methods=["POST"])
 def get_cover_letter(job_id):
-    cover = clsvc.generate_and_store_cover_letter(job_id)
+    cover = clsvc.generate_and_store_cover_letter(_config(), job_id)
     return jsonify({"cover_letter": cover})
+
+EXPORT_MIMETYPES = {
+    "csv": "text/csv",
+    "jsonl": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+@web_bp.route("/export/<fmt>")
+def export_jobs(fmt):
+    """
+    Stream the jobs table as csv/jsonl/parquet. Optional query args:
+    table=jobs|filtered, columns=a,b,c, since=<date_loaded>, since_id=<id>.
+    """
+    if fmt not in exportsvc.EXPORT_FORMATS:
+        return jsonify({"error": f"Unsupported export format: {fmt}"}), 400
+    if fmt == "parquet" and not exportsvc.parquet_available():
+        return jsonify({"error": "Parquet export requires pyarrow"}), 400
+
+    config = _config()
+    table_name = resolve_table(config, request.args.get("table", "jobs"))
+    columns = [c.strip() for c in request.args["columns"].split(",")] if request.args.get("columns") else None
+    since = request.args.get("since")
+    since_id = request.args.get("since_id", type=int)
+
+    with closing(dbsvc.connect(config)) as conn:
+        if not table_exists(conn, table_name):
+            return jsonify({"error": f"Table {table_name} does not exist"}), 404
+        try:
+            column_types = exportsvc.select_columns(conn, table_name, columns)
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+    names = [name for name, _ in column_types]
+
+    def generate():
+        # The streaming connection is opened only once the body is iterated,
+        # so a client that disconnects early leaves nothing open.
+        conn = dbsvc.connect(config)
+        try:
+            chunks = exportsvc.iter_chunks(conn, table_name, names, since=since, since_id=since_id)
+            if fmt == "parquet":
+                # Parquet needs its footer written last, so spool to a temp
+                # file (on disk, not in memory) and stream that back.
+                with tempfile.TemporaryFile() as tmp:
+                    exportsvc.write_parquet(tmp, column_types, chunks)
+                    tmp.seek(0)
+                    while True:
+                        block = tmp.read(1 << 16)
+                        if not block:
+                            break
+                        yield block
+            else:
+                stream = exportsvc.stream_csv if fmt == "csv" else exportsvc.stream_jsonl
+                yield from stream(names, chunks)
+        finally:
+            conn.close()
+
+    filename = f"{table_name}.{fmt}"
+    return Response(
+        stream_with_context(generate()),
+        mimetype=EXPORT_MIMETYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )